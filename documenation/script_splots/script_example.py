@@ -4,7 +4,6 @@ Example script to set release from splots, includes diffusion and wind mover
 """
 
 import os
-import math
 from datetime import datetime, timedelta
 
 import numpy as np
@@ -60,12 +59,9 @@ def make_model(images_dir):
     netcdf_file = os.path.join(base_dir, 'script_example.nc')
 
     # DPZ
-    lon = release.custom_positions[:,0]
-    lat = release.custom_positions[:,1]
-    xmn = math.floor(np.min(lon) - 0.5)
-    xmx = math.ceil( np.max(lon) + 0.5)
-    ymn = math.floor(np.min(lat) - 0.5)
-    ymx = math.ceil( np.max(lat) + 0.5)
+    lon_lat = release.custom_positions[:, :2]
+    xmn, ymn = np.floor(lon_lat.min(axis=0) - 0.5)
+    xmx, ymx = np.ceil(lon_lat.max(axis=0) + 0.5)
     viewport = ((xmn, ymn), (xmx, ymx))
     model.outputters += [Renderer(output_dir=images_dir, size=(800, 800), projection_class=GeoProjection, viewport=viewport),
                          NetCDFOutput(netcdf_file)]
@@ -10,7 +10,6 @@ initialize_console_log(level='debug')
 
 """
 
-from itertools import chain
 
 import sys
 
@@ -142,8 +141,8 @@ def _valid_units(unit_name):
     convenience function to get all valid units accepted by nucos
     '''
     _valid_units = list(uc.unit_conversion.GetUnitNames(unit_name))
-    _valid_units.extend(chain(*[val[1] for val in
-                                uc.ConvertDataUnits[unit_name].values()]))
+    _valid_units.extend(name for val in uc.ConvertDataUnits[unit_name].values()
+                        for name in val[1])
     return tuple(_valid_units)
 
 
@@ -32,7 +32,10 @@ Two by two grid, values on the nodes: ::
 
 """
 
+import io
+import re
 from datetime import datetime
+
 import numpy as np
 
 
@@ -42,7 +45,13 @@ from .gridded_objects_base import (Time, Variable, VectorVariable, Grid_R)
 data_types = {"GRIDCURTIME": "currents",
               "GRIDWINDTIME": "winds",
               }
-data_type_tags = {val: key for key, val in data_types.items()}
+# the reverse mapping -- keep in sync with data_types
+data_type_tags = {"currents": "GRIDCURTIME",
+                  "winds": "GRIDWINDTIME",
+                  }
+
+# a [TIME] line -- captures the day month year hour minute fields
+TIME_LINE = re.compile(r"^\s*\[TIME\](.*)$", re.MULTILINE)
 
 class GridCurReadError(Exception):
     """
@@ -104,7 +113,8 @@ def init_from_gridcur(gc,
 
     grid = Grid_R(node_lon=lon, node_lat=lat)
 
-    time = Time(data=times)
+    # Time wants datetime objects
+    time = Time(data=times.tolist())
 
     U = Variable(
         name=f"eastward surface velocity",
@@ -138,10 +148,22 @@ def init_from_gridcur(gc,
                 extrapolation_is_allowed=extrapolation_is_allowed,
                 **kwargs)
 
-def read_file(filename):
+def read_file(filename, dtype=np.float64):
+    """
+    read a gridcur file
+
+    :param filename: name (full path) of the gridcur file to load
+
+    :param dtype=np.float64: dtype of the returned velocity arrays.
+                             The file only holds 6 decimal places, so
+                             np.float32 is enough if memory is tight.
+
+    :returns: data_type, units, times, lon, lat, data_u, data_v
+
+              times is a datetime64 array, data_u and data_v are
+              (time, row, col) arrays
+    """
     times = []
-    data_u = []
-    data_v = []
     grid_info = {}
     try:
         with open(filename, encoding='utf-8') as infile:
@@ -162,30 +184,33 @@ def read_file(filename):
                 data = line.split()
                 grid_info[data[0].strip()] = float(data[1])
 
-            # read the data - one timestep at a time
-            while True:
-                if line.strip().startswith("[TIME]"):
-                    time = [int(num) for num in line.split()[1:]]
-                    times.append(datetime(time[2], time[1], time[0], time[3], time[4]))
-                    lon, lat, U, V = make_grid_arrays(grid_info)
-                    data_u.append(U)
-                    data_v.append(V)
-                    line = infile.readline()
-                    continue
-                elif not line:
-                    break
-                data = line.split()
-                row = int(data[0]) - 1
-                col = int(data[1]) - 1
-                u = float(data[2])
-                v = float(data[3])
-                U[row, col] = u
-                V[row, col] = v
-                line = infile.readline()
-
-            # put the velocities together in a single array
-            data_u = np.array(data_u)
-            data_v = np.array(data_v)
+            # the grid is the same for every timestep, so only build it once
+            lon, lat, U, V = make_grid_arrays(grid_info, dtype=dtype)
+
+            # read the data -- all at once, then split it into timesteps.
+            # each timestep is a [TIME] line followed by one line per cell:
+            # row col u v
+            sections = TIME_LINE.split(line + infile.read())
+            if sections[0].strip():
+                raise ValueError(f"Expected a [TIME] line, got: {sections[0]}")
+            blocks = []
+            for time, block in zip(sections[1::2], sections[2::2]):
+                time = [int(num) for num in time.split()]
+                times.append(datetime(time[2], time[1], time[0], time[3], time[4]))
+                # parse the whole block at once, rather than line by line
+                blocks.append(np.array(block.split(),
+                                       dtype=np.float64).reshape(-1, 4))
+
+            # put the velocities together in single (time, row, col) arrays
+            data_u = np.zeros((len(blocks),) + U.shape, dtype=U.dtype)
+            data_v = np.zeros((len(blocks),) + V.shape, dtype=V.dtype)
+            for U, V, block in zip(data_u, data_v, blocks):
+                rows = block[:, 0].astype(np.intp) - 1
+                cols = block[:, 1].astype(np.intp) - 1
+                U[rows, cols] = block[:, 2]
+                V[rows, cols] = block[:, 3]
+
+            times = np.array(times, dtype='datetime64[s]')
     # so that we will get the same error type regardless
     except Exception as ex:
         raise GridCurReadError from ex
@@ -208,34 +233,52 @@ def write_gridcur(filename, data_type, units, times, lon, lat, data_u, data_v):
     else:
         raise ValueError("shape mismatch between lat, lon, and data arrays")
 
+    # build the whole file in memory, and write it out in one go
+    buf = io.StringIO()
+    buf.write(f'[{data_type_tags[data_type]}] ')
+    buf.write(f"{units}\n")
+    buf.write(f"NUMROWS {data_u[0].shape[0]}\n")
+    buf.write(f"NUMCOLS {data_u[0].shape[1]}\n")
+    if location == "cells":
+        buf.write(f"LOLAT {lat[0]}\n")
+        buf.write(f"HILAT {lat[-1]}\n")
+        buf.write(f"LOLONG {lon[0]}\n")
+        buf.write(f"HILONG {lon[-1]}\n")
+    elif location == "nodes":
+        buf.write(f"STARTLAT {lat[0]}\n")
+        buf.write(f"STARTLONG {lon[0]}\n")
+        buf.write(f"DLAT {(lat[-1] - lat[0]) / (len(lat) - 1)}\n")
+        buf.write(f"DLONG {(lon[-1] - lon[0]) / (len(lon) - 1)}\n")
+
+    # the (1-based) row and column indexes are the same for every
+    # timestep, so only compute them once
+    num_rows, num_cols = data_u[0].shape
+    rows, cols = np.meshgrid(np.arange(1, num_rows + 1),
+                             np.arange(1, num_cols + 1),
+                             indexing='ij')
+    rows = rows.ravel()
+    cols = cols.ravel()
+    # works for datetime or datetime64 times
+    times = np.asarray(times, dtype='datetime64[s]').tolist()
+    for time, U, V in zip(times, data_u, data_v):
+        buf.write(f"[TIME] {time.day} {time.month} {time.year} "
+                  f"{time.hour} {time.minute}\n")
+        np.savetxt(buf,
+                   np.column_stack((rows, cols,
+                                    np.ravel(U), np.ravel(V))),
+                   fmt="%4d %4d %10.6f %10.6f")
+
     with open(filename, 'w', encoding='utf-8') as outfile:
-        outfile.write(f'[{data_type_tags[data_type]}] ')
-        outfile.write(f"{units}\n")
-        outfile.write(f"NUMROWS {data_u[0].shape[0]}\n")
-        outfile.write(f"NUMCOLS {data_u[0].shape[1]}\n")
-        if location == "cells":
-            outfile.write(f"LOLAT {lat[0]}\n")
-            outfile.write(f"HILAT {lat[-1]}\n")
-            outfile.write(f"LOLONG {lon[0]}\n")
-            outfile.write(f"HILONG {lon[-1]}\n")
-        elif location == "nodes":
-            outfile.write(f"STARTLAT {lat[0]}\n")
-            outfile.write(f"STARTLONG {lon[0]}\n")
-            outfile.write(f"DLAT {(lat[-1] - lat[0]) / (len(lat) - 1)}\n")
-            outfile.write(f"DLONG {(lon[-1] - lon[0]) / (len(lon) - 1)}\n")
-        for time, U, V in zip(times, data_u, data_v):
-            outfile.write(f"[TIME] {time.day} {time.month} {time.year} "
-                          f"{time.hour} {time.minute}\n")
-            for row in range(U.shape[0]):
-                for col in range(U.shape[1]):
-                    outfile.write(f"{row+1:4d} {col+1:4d} "
-                                  f"{U[row, col]:10.6f} {V[row, col]:10.6f}\n")
-
-def make_grid_arrays(grid_info):
+        outfile.write(buf.getvalue())
+
+
+def make_grid_arrays(grid_info, dtype=np.float64):
     """
     Build the arrays for the grid and data
 
     :param grid_info: a dict of the grid information from the header
+
+    :param dtype=np.float64: dtype of the data arrays
     """
 
     try:
@@ -257,8 +300,8 @@ def make_grid_arrays(grid_info):
             lon = np.linspace(min_lon, min_lon + (dlon * (num_rows - 1)), num_rows)
     except KeyError:
         raise ValueError("File does not have full grid specification")
-    U = np.zeros((num_rows, num_cols), dtype=np.float64)
-    V = np.zeros((num_rows, num_cols), dtype=np.float64)
+    U = np.zeros((num_rows, num_cols), dtype=dtype)
+    V = np.zeros((num_rows, num_cols), dtype=dtype)
 
     return lon, lat, U, V
 
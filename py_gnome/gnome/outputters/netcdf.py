@@ -218,6 +218,11 @@ class NetCDFOutput(Outputter, OutputterFilenameMixin):
     which_data_lu = {'standard', 'most', 'all'}
     compress_lu = {True, False}
 
+    # deflate level used when compress is True. Level 1 gets most of the
+    # size reduction of the (netCDF4 default) level 4, at a fraction of
+    # the cost of writing every timestep.
+    complevel = 1
+
     cf_attributes = {'comment': 'Particle output from the NOAA PyGnome model',
                      'source': 'PyGnome version {0}'.format(__version__),
                      'references': 'TBD',
@@ -275,6 +280,7 @@ class NetCDFOutput(Outputter, OutputterFilenameMixin):
                  zip_output=False,
                  which_data='standard',
                  compress=True,
+                 chunksize=1024,
                  # FIXME: this should not be default, but since we don't have
                  #        a way for WebGNOME to set it yet..
                  surface_conc="kde",
@@ -301,6 +307,10 @@ class NetCDFOutput(Outputter, OutputterFilenameMixin):
             attributes
         :type which_data: string -- one of {'standard', 'most', 'all'}
 
+        :param chunksize=1024: number of elements per chunk along the 'data'
+            (and 'time') dimension of the NetCDF variables.
+        :type chunksize: int
+
         Optional arguments passed on to base class (kwargs):
 
         :param cache: sets the cache object from which to read data. The model
@@ -367,7 +377,7 @@ class NetCDFOutput(Outputter, OutputterFilenameMixin):
         # we don't want to have far-too-large files for the
         # smaller ones
         # The default in netcdf4 is 1 -- which works really badly
-        self._chunksize = 1024
+        self._chunksize = chunksize
 
         # need to keep track of starting index for writing data since variable
         # number of particles are released
@@ -651,6 +661,7 @@ class NetCDFOutput(Outputter, OutputterFilenameMixin):
                                      dtype,
                                      shape,
                                      zlib=self._compress,
+                                     complevel=self.complevel,
                                      chunksizes=chunksz)
 #             this should be fixed now since non_weathering is initialized
 #             if var_name != "non_weathering":
@@ -674,9 +685,10 @@ class NetCDFOutput(Outputter, OutputterFilenameMixin):
                    "\tshape: {}\n"
                    "\tdims: {}\n"
                    "\tzlib: {}\n"
+                   "\tcomplevel: {}\n"
                    "\tchunksizes: {}\n"
                    .format(var_name, dtype, shape, grp.dimensions,
-                           self._compress, chunksz))
+                           self._compress, self.complevel, chunksz))
 
             err.args = (err.args[0] + msg,)
 
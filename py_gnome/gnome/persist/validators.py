@@ -66,6 +66,27 @@ def ascending_datetime(node, values):
                       'ascending order')
 
 
+def ascending_time_intervals(node, values):
+    """
+    Check a sequence of (start, end) datetime intervals: the start times
+    must be in ascending order with no duplicates, and each interval must
+    end after it starts.
+    """
+    if len(values) == 0:
+        return
+
+    times = np.array([(t[0], t[-1]) for t in values], dtype='datetime64[us]')
+
+    # strictly increasing covers both duplicates and order in one pass
+    if np.any(np.diff(times[:, 0]) <= np.timedelta64(0)):
+        raise Invalid(node,
+                      'The start times must be in ascending order, '
+                      'with no duplicates')
+
+    if np.any(times[:, 1] <= times[:, 0]):
+        raise Invalid(node, 'Each interval must end after it starts')
+
+
 #==============================================================================
 # def degrees_true(node, direction):
 #    if 0 > direction > 360:
@@ -231,6 +231,7 @@ class GnomeOil(Substance):
                                  'mass_components': gat('mass_components')})
         self.array_types['mass_components'].shape = (self.num_components,)
         self.array_types['mass_components'].initial_value = (self.mass_fraction,)
+        self._invalidate_array_types()
 
     def _init_from_json(self,
                         # Physical properties
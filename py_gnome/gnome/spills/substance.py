@@ -116,16 +116,41 @@ class Substance(GnomeId):
             'density': gat('density'),
             'fate_status': gat('fate_status')})
 
+    @property
+    def initializers(self):
+        return self._initializers
+
+    @initializers.setter
+    def initializers(self, initializers):
+        self._initializers = list(initializers)
+        self._invalidate_array_types()
+
+    def _invalidate_array_types(self):
+        '''
+        Clear the cached all_array_types and initializer array names.
+
+        Must be called whenever the initializers, or the array_types,
+        are changed after the Substance is created.
+        '''
+        self._all_array_types = None
+        self._initializer_arrays = None
+
     @property
     def all_array_types(self):
         '''
+        The array_types of the substance and all its initializers.
+
+        This is cached, so the returned dict should not be modified.
+
         Fixme: should the initializers be what holds the array types?
                 don't we know that this should have already?
         '''
-        arr = self.array_types.copy()
-        for init in self.initializers:
-            arr.update(init.all_array_types)
-        return arr
+        if self._all_array_types is None:
+            arr = self.array_types.copy()
+            for init in self.initializers:
+                arr.update(init.all_array_types)
+            self._all_array_types = arr
+        return self._all_array_types
 
     # fixme: can't we make this a regular attribute??
     @property
@@ -183,23 +208,18 @@ class Substance(GnomeId):
 
     def get_initializer_by_name(self, name):
         ''' get first initializer in list whose name matches 'name' '''
-        init = [i for i in enumerate(self.initializers) if i.name == name]
-
-        if len(init) == 0:
-            return None
-        else:
-            return init[0]
+        return next((i for i in self.initializers if i.name == name), None)
 
     def has_initializer(self, name):
         '''
         Returns True if an initializer is present in the list which sets the
         data_array corresponding with 'name', otherwise returns False
         '''
-        for i in self.initializers:
-            if name in i.array_types:
-                return True
+        if self._initializer_arrays is None:
+            self._initializer_arrays = {arr for i in self.initializers
+                                        for arr in i.array_types}
 
-        return False
+        return name in self._initializer_arrays
 
     def initialize_LEs(self, to_rel, arrs, environment=None):
         '''
@@ -273,9 +293,8 @@ class NonWeatheringSubstance(Substance):
         :param to_rel - number of new LEs to initialize
         :param arrs - dict-like of data arrays representing LEs
         '''
-        sl = slice(-to_rel, None, 1)
-        if ('fate_status' in arrs):
-            arrs['fate_status'][sl] = fate.non_weather
+        if 'fate_status' in arrs:
+            arrs['fate_status'][-to_rel:] = fate.non_weather
         super(NonWeatheringSubstance, self).initialize_LEs(to_rel, arrs, environment=environment)
 
 
@@ -306,6 +325,7 @@ class SubsurfaceSubstance(NonWeatheringSubstance):
         init = InitRiseVelFromDropletSizeFromDist(distribution=distribution)
         self.initializers.append(init)
         self.array_types.update(init.array_types)
+        self._invalidate_array_types()
 
 
 
@@ -2,7 +2,6 @@
 model dissolution process
 '''
 
-import copy
 import contextlib
 
 import numpy as np
@@ -17,12 +16,10 @@ from gnome.array_types import gat
 from .core import WeathererSchema
 from gnome.weatherers import Weatherer
 
-from pprint import PrettyPrinter
 from gnome.environment.waves import WavesSchema
 from gnome.persist.base_schema import GeneralGnomeObjectSchema
 from gnome.environment.wind import WindSchema
 from gnome.environment.gridded_objects_base import VectorVariableSchema
-pp = PrettyPrinter(indent=2, width=120)
 
 
 @contextlib.contextmanager
@@ -77,12 +74,18 @@ class Dissolution(Weatherer):
                                  'droplet_avg_size': gat('droplet_avg_size')
                                  })
 
+        # per-substance constants, keyed by substance id
+        self._substance_constants = {}
+
     def prepare_for_model_run(self, sc):
         '''
             Add dissolution key to mass_balance if it doesn't exist.
             - Assumes all spills have the same type of oil
             - let's only define this the first time
         '''
+        # the substance may have changed since the last run
+        self._substance_constants = {}
+
         if self.on:
             super(Dissolution, self).prepare_for_model_run(sc)
             sc.mass_balance['dissolution'] = 0.0
@@ -119,6 +122,35 @@ class Dissolution(Weatherer):
         '''
         pass
 
+    def substance_constants(self, substance):
+        '''
+            The per-component values of the substance used by dissolve_oil().
+            These don't change over a run, so they are computed once per
+            substance and cached.
+
+            :returns: (arom_mask, mol_wt, rho, K_ow_comp)
+        '''
+        if substance.id in self._substance_constants:
+            return self._substance_constants[substance.id]
+
+        #arom_mask = substance._sara['type'] == 'Aromatics'
+        sara = np.asarray(substance.sara_type)
+        arom_mask = sara == 'Aromatics'
+
+        mol_wt = substance.molecular_weight
+        rho = substance.component_density
+
+        assert mol_wt.shape == rho.shape
+
+        # calculate the partition coefficient (K_ow) for all aromatics
+        # K_ow for non-aromatics are masked to 0.0
+        K_ow_comp = arom_mask * BanerjeeHuibers.partition_coeff(mol_wt, rho)
+
+        consts = (arom_mask, mol_wt, rho, K_ow_comp)
+        self._substance_constants[substance.id] = consts
+
+        return consts
+
     # this will have to be updated; SARA is being refactored out of gnome_oil
     def dissolve_oil(self, data, substance, **kwargs):
         '''
@@ -169,21 +201,12 @@ class Dissolution(Weatherer):
 
         # print 'droplet_avg_sizes = ', droplet_avg_sizes
 
-        #arom_mask = substance._sara['type'] == 'Aromatics'
-        sara = np.asarray(substance.sara_type)
-        arom_mask = sara == 'Aromatics'
-
-        mol_wt = substance.molecular_weight
-        rho = substance.component_density
-
-        assert mol_wt.shape == rho.shape
+        arom_mask, mol_wt, rho, K_ow_comp = self.substance_constants(substance)
 
-        # calculate the partition coefficient (K_ow) for all aromatics
+        # calculate the molar averaged partition coefficient (K_ow)
         # for each LE.
-        # K_ow for non-aromatics are masked to 0.0
-        K_ow_comp = arom_mask * BanerjeeHuibers.partition_coeff(mol_wt, rho)
-        data['partition_coeff'] = ((fmasses * K_ow_comp / mol_wt).sum(axis=1) /
-                                   (fmasses / mol_wt).sum(axis=1))
+        moles = fmasses / mol_wt
+        data['partition_coeff'] = (moles @ K_ow_comp) / moles.sum(axis=1)
 
         avg_rhos = self.oil_avg_density(fmasses, rho)
         # print ('oil density at temp = {}'
@@ -198,16 +221,23 @@ class Dissolution(Weatherer):
 
         total_volumes = self.oil_total_volume(fmasses, rho)
 
-        f_wc_i = self.water_column_time_fraction(points,model_time, k_w_i)
+        # the wind and wave conditions are the same for the water column
+        # and slick calculations, so only look them up once
+        wind_speed, wave_period, f_bw = self.breaking_wave_conditions(points,
+                                                                      model_time)
+
+        f_wc_i = self.water_column_time_fraction(points, model_time, k_w_i,
+                                                 wave_period, f_bw)
         T_wc_i = f_wc_i * time_step
         # print 'T_wc_i = ', T_wc_i
 
-        T_calm_i = self.calm_between_wave_breaks(points,model_time, time_step, T_wc_i)
+        T_calm_i = self.calm_between_wave_breaks(time_step, wave_period, f_bw,
+                                                 T_wc_i)
         # print 'T_calm_i = ', T_calm_i
 
-        assert np.alltrue(T_calm_i <= float(time_step))
-        assert np.alltrue(T_wc_i <= float(time_step))
-        assert np.alltrue(T_wc_i + T_calm_i <= float(time_step))
+        assert np.all(T_calm_i <= float(time_step))
+        assert np.all(T_wc_i <= float(time_step))
+        assert np.all(T_wc_i + T_calm_i <= float(time_step))
 
         oil_concentrations = self.oil_concentration(fmasses, rho)
 
@@ -231,8 +261,7 @@ class Dissolution(Weatherer):
         # with printoptions(precision=2):
         #     print 'mass_dissolved_in_wc = ', mass_dissolved_in_wc
 
-        N_s_i = self.slick_subsurface_mass_xfer_rate(points,
-                                                     model_time,
+        N_s_i = self.slick_subsurface_mass_xfer_rate(wind_speed,
                                                      oil_concentrations,
                                                      K_ow_comp,
                                                      areas,
@@ -258,18 +287,17 @@ class Dissolution(Weatherer):
 
         return total_mass_dissolved
 
+    # The per-LE reductions over the components below are written as
+    # matrix-vector products, so they work the same for a single LE of
+    # mass components (1D) or multiple LEs (2D), and each is a single pass
+    # over the mass components.
+
     def oil_avg_density(self, masses, densities):
         # oil component count needs to match
         assert masses.shape[-1] == densities.shape[-1]
         assert len(densities.shape) == 1  # single dimension
 
-        if len(masses.shape) == 1:
-            # a single LE of mass components
-            avg_rho = (masses / masses.sum() * densities).sum()
-        else:
-            # multiple LE mass components in a 2D array
-            avg_rho = (((masses.T / masses.sum(axis=1).T).T * densities)
-                       .sum(axis=1))
+        avg_rho = (masses @ densities) / masses.sum(axis=-1)
 
         return np.nan_to_num(avg_rho)
 
@@ -278,12 +306,7 @@ class Dissolution(Weatherer):
         assert masses.shape[-1] == densities.shape[-1]
         assert len(densities.shape) == 1  # single dimension
 
-        if len(masses.shape) == 1:
-            # a single LE of mass components
-            return (masses / densities).sum()
-        else:
-            # multiple LE mass components in a 2D array
-            return (masses / densities).sum(axis=1)
+        return masses @ (1.0 / densities)
 
     def state_variable(self, masses, densities, arom_mask):
         # oil component count needs to match
@@ -293,49 +316,48 @@ class Dissolution(Weatherer):
 
         not_arom_mask = arom_mask ^ True
 
-        if len(masses.shape) == 1:
-            # a single LE of mass components
-            aromatic_volume = (masses / densities * arom_mask).sum()
-            S_RA_volume = (masses / densities * not_arom_mask).sum()
+        aromatic_volume = masses @ (arom_mask / densities)
+        S_RA_volume = masses @ (not_arom_mask / densities)
 
-            return aromatic_volume / S_RA_volume, S_RA_volume
-        else:
-            # multiple LE mass components in a 2D array
-            aromatic_volume = (masses / densities * arom_mask).sum(axis=1)
-            S_RA_volume = (masses / densities * not_arom_mask).sum(axis=1)
-
-            return aromatic_volume / S_RA_volume, S_RA_volume
+        return aromatic_volume / S_RA_volume, S_RA_volume
 
     def beta_coeff(self, k_w, K_ow, v_inert):
         return 4.84 * k_w / K_ow * v_inert ** (2.0 / 3.0)
 
-    def water_column_time_fraction(self,
-                                   points,
-                                   model_time,
-                                   water_phase_xfer_velocity):
-        wave_height = self.waves.get_value(points, model_time)[0]
+    def breaking_wave_conditions(self, points, model_time):
+        '''
+            The wind speed, peak wave period and fraction of breaking waves
+            at the LE positions.
+
+            :returns: (wind_speed, wave_period, breaking_waves_frac)
+        '''
         wind_speed = np.clip(self.get_wind_speed(points, model_time), 0.01, None)
         wave_period = PiersonMoskowitz.peak_wave_period(wind_speed)
 
         f_bw = DelvigneSweeney.breaking_waves_frac(wind_speed, wave_period)
 
-        return DingFarmer.water_column_time_fraction(f_bw,
+        return wind_speed, wave_period, f_bw
+
+    def water_column_time_fraction(self,
+                                   points,
+                                   model_time,
+                                   water_phase_xfer_velocity,
+                                   wave_period,
+                                   breaking_waves_frac):
+        wave_height = self.waves.get_value(points, model_time)[0]
+
+        return DingFarmer.water_column_time_fraction(breaking_waves_frac,
                                                      wave_period,
                                                      wave_height,
                                                      water_phase_xfer_velocity)
 
     def calm_between_wave_breaks(self,
-                                 points,
-                                 model_time,
                                  time_step,
+                                 wave_period,
+                                 breaking_waves_frac,
                                  time_spent_in_wc=0.0):
-        #wind_speed = max(.1, self.waves.wind.get_value(model_time)[0])
-        wind_speed = np.clip(self.get_wind_speed(points, model_time), 0.01, None)
-        wave_period = PiersonMoskowitz.peak_wave_period(wind_speed)
-
-        f_bw = DelvigneSweeney.breaking_waves_frac(wind_speed, wave_period)
-
-        T_calm = DingFarmer.calm_between_wave_breaks(f_bw, wave_period)
+        T_calm = DingFarmer.calm_between_wave_breaks(breaking_waves_frac,
+                                                     wave_period)
 
         return np.clip(T_calm, 0.0, float(time_step) - time_spent_in_wc)
 
@@ -344,18 +366,10 @@ class Dissolution(Weatherer):
         assert masses.shape[-1] == densities.shape[-1]
         assert len(densities.shape) == 1  # single dimension
 
-        if len(masses.shape) == 1:
-            # a single LE of mass components
-            mass_fractions = masses / masses.sum()
-            aggregate_rho = (mass_fractions * densities).sum()
-
-            return mass_fractions * aggregate_rho
-        else:
-            # multiple LE mass components in a 2D array
-            mass_fractions = (masses.T / masses.sum(axis=1)).T
-            aggregate_rho = (mass_fractions * densities).sum(axis=1)
+        mass_fractions = masses / masses.sum(axis=-1, keepdims=True)
+        aggregate_rho = mass_fractions @ densities
 
-            return (mass_fractions.T * aggregate_rho).T
+        return mass_fractions * aggregate_rho[..., np.newaxis]
 
     def droplet_subsurface_mass_xfer_rate(self,
                                           droplet_avg_size,
@@ -434,8 +448,7 @@ class Dissolution(Weatherer):
         return np.nan_to_num(N_drop)
 
     def slick_subsurface_mass_xfer_rate(self,
-                                        points,
-                                        model_time,
+                                        wind_speed,
                                         oil_concentration,
                                         partition_coeff,
                                         slick_area,
@@ -455,8 +468,7 @@ class Dissolution(Weatherer):
         assert oil_concentration.shape[-1] == partition_coeff.shape[-1]
         assert len(partition_coeff.shape) == 1  # single dimension
 
-        #U_10 = max(.1, self.waves.wind.get_value(model_time)[0])
-        U_10 = np.clip(self.get_wind_speed(points, model_time), 0.01, None).reshape(-1,1)
+        U_10 = wind_speed.reshape(-1, 1)
         c_oil = oil_concentration
         k_ow = partition_coeff
 
@@ -512,7 +524,8 @@ class Dissolution(Weatherer):
 
             sc.mass_balance['dissolution'] += diss.sum()
 
-            data['mass'] = data['mass_components'].sum(1)
+            # update the existing mass array rather than allocating a new one
+            np.sum(data['mass_components'], axis=1, out=data['mass'])
 
             self.logger.debug('{0} Amount dissolved for {1}: {2}'
                               .format(self._pid,
@@ -6,7 +6,7 @@ add these as weatherers
 import os
 import json
 from datetime import timedelta
-# from collections import OrderedDict
+from functools import lru_cache
 
 import numpy as np
 
@@ -17,14 +17,14 @@ from gnome.persist import (drop, SchemaNode, MappingSchema, OneOf,
                            Int, Float, String, DateTime)
 
 from gnome import _valid_units
-from gnome.basic_types import oil_status, fate as bt_fate
+from gnome.basic_types import fate as bt_fate
 from gnome.array_types import gat
 
 
 from gnome.weatherers import Weatherer
 from gnome.weatherers.core import WeathererSchema
 
-from gnome.persist import base_schema
+from gnome.persist import base_schema, validators
 from gnome.gnomeobject import GnomeId
 from gnome.persist.base_schema import GeneralGnomeObjectSchema
 from gnome.environment.wind import WindSchema
@@ -40,6 +40,22 @@ _valid_time_units = _valid_units('Time')
 _valid_oil_concentration_units = _valid_units('Oil Concentration')
 _valid_concentration_units = _valid_units('Concentration In Water')
 
+# encounter rate (gal/min) for a 1 ft swath at 1 knot through 1 inch of oil
+_ENCOUNTER_K = 63.13
+# area coverage rate (acres/min) for a 1 ft swath at 1 knot
+_COVERAGE_K = 0.00233
+
+
+@lru_cache(maxsize=None)
+def _conv_factor(unit_type, from_unit, to_unit):
+    '''
+    Factor to convert from from_unit to to_unit.
+
+    All the unit types used by the responses are linear, so the factor
+    only has to be looked up once for each pair of units.
+    '''
+    return uc.convert(unit_type, from_unit, to_unit, 1.0)
+
 
 class OnSceneTupleSchema(TupleSchema):
     start = SchemaNode(DateTime(default_tzinfo=None))
@@ -49,12 +65,11 @@ class OnSceneTupleSchema(TupleSchema):
 class OnSceneTimeSeriesSchema(SequenceSchema):
     value = OnSceneTupleSchema()
 
-#     def validator(self, node, cstruct):
-#         '''
-#         validate on-scene timeseries list
-#         '''
-#         validators.no_duplicate_datetime(node, cstruct)
-#         validators.ascending_datetime(node, cstruct)
+    def validator(self, node, cstruct):
+        '''
+        validate on-scene timeseries list
+        '''
+        validators.ascending_time_intervals(node, cstruct)
 
 
 class ResponseSchema(WeathererSchema):
@@ -74,16 +89,47 @@ class Response(Weatherer):
         self.timeseries = timeseries
         self._report = []
 
-    def _get_thickness(self, sc):
+    @property
+    def timeseries(self):
+        return self._timeseries
+
+    @timeseries.setter
+    def timeseries(self, timeseries):
+        '''
+        Also keeps the interval start and end times as datetime64 arrays,
+        so _is_active() can check them all at once.
+        '''
+        self._timeseries = timeseries
+
+        if timeseries is None:
+            timeseries = []
+
+        self._ts_start = np.array([t[0] for t in timeseries],
+                                  dtype='datetime64[us]')
+        self._ts_stop = np.array([t[-1] for t in timeseries],
+                                 dtype='datetime64[us]')
+
+    def _get_thickness(self, sc, frac_water=None):
+        '''
+        Mean thickness of the oil, in inches
+
+        :param frac_water=None: the mean water fraction of the LEs, if the
+                                caller has already computed it.
+        '''
         oil_thickness = 0.0
-        substance = self._get_substance(sc)
-        
-        if sc['area'].any() > 0:
-            volume_emul = ((sc['mass'].mean() / substance.density_at_temp()) /
-                           (1.0 - sc['frac_water'].mean()))
-            oil_thickness = volume_emul / sc['area'].mean()
+        total_area = sc['area'].sum()
+
+        if total_area > 0:
+            substance = self._get_substance(sc)
+            if frac_water is None:
+                frac_water = sc['frac_water'].mean()
+            # mean(mass) / mean(area) == sum(mass) / sum(area), so the
+            # area sum does double duty as the check and the divisor
+            volume_emul = ((sc['mass'].sum() / substance.density_at_temp()) /
+                           (1.0 - frac_water))
+            oil_thickness = volume_emul / total_area
 
-        return uc.convert('Length', 'meters', 'inches', oil_thickness)
+        return oil_thickness * _conv_factor('Length', 'meters', 'inches')
 
     @property
     def units(self):
@@ -113,8 +159,8 @@ class Response(Weatherer):
                 unit = self._si_units[attr]
 
         if unit in self._units_type[attr][1]:
-            return uc.convert(self._units_type[attr][0], self.units[attr],
-                              unit, val)
+            return val * _conv_factor(self._units_type[attr][0],
+                                      self.units[attr], unit)
         else:
             ex = uc.InvalidUnitError((unit, self._units_type[attr][0]))
             self.logger.error(str(ex))
@@ -128,12 +174,11 @@ class Response(Weatherer):
         self.units[attr] = unit
 
     def _is_active(self, model_time, time_step):
-        for t in self.timeseries:
-            if (model_time >= t[0] and
-                    model_time + timedelta(seconds=time_step / 2) <= t[1]):
-                return True
+        model_time = np.datetime64(model_time, 'us')
+        half_step = np.timedelta64(round(time_step * 500000), 'us')
 
-        return False
+        return bool(np.any((self._ts_start <= model_time) &
+                           (model_time + half_step <= self._ts_stop)))
 
     def _setup_report(self, sc):
         if 'report' not in sc:
@@ -160,8 +205,9 @@ class Response(Weatherer):
         total_mass = data['mass'].sum()
         rm_mass_frac = min(amount / total_mass, 1.0)
 
-        data['mass_components'] = (1 - rm_mass_frac) * data['mass_components']
-        data['mass'] = data['mass_components'].sum(1)
+        # scale and re-sum in place, rather than allocating new arrays
+        data['mass_components'] *= 1 - rm_mass_frac
+        np.sum(data['mass_components'], axis=1, out=data['mass'])
 
         return total_mass - data['mass'].sum()
 
@@ -185,11 +231,10 @@ class Response(Weatherer):
         Returns the index of the timeseries entry that the time specified
         is within. If it is not in one of the intervals, -1 will be returned
         '''
-        for i, t in enumerate(self.timeseries):
-            if time >= t[0] and time < t[-1]:
-                return i
+        time = np.datetime64(time, 'us')
+        idx = np.flatnonzero((self._ts_start <= time) & (time < self._ts_stop))
 
-        return -1
+        return int(idx[0]) if len(idx) > 0 else -1
 
     def next_interval_index(self, time):
         '''
@@ -210,11 +255,12 @@ class Response(Weatherer):
             return idx + 1 if idx + 1 != len(self.timeseries) else None
 
         if idx == -1:
-            # outside timeseries intervals
-            for i, _t in enumerate(self.timeseries[0:-1]):
-                if (time >= self.timeseries[i][-1] and
-                        time < self.timeseries[i + 1][0]):
-                    return i + 1
+            # outside timeseries intervals -- find the gap it is in
+            time = np.datetime64(time, 'us')
+            gaps = np.flatnonzero((self._ts_stop[:-1] <= time) &
+                                  (time < self._ts_start[1:]))
+            if len(gaps) > 0:
+                return int(gaps[0]) + 1
 
     def time_to_next_interval(self, time):
         '''
@@ -303,30 +349,40 @@ class Platform(GnomeId):
              "pump_rate_max": ('gal/min', 'discharge', _valid_dis_units),
              "pump_rate_min": ('gal/min', 'discharge', _valid_dis_units)}
 
-    _si_units = dict([(k, v[0]) for k, v in _attr.items()])
+    _si_units = {k: v[0] for k, v in _attr.items()}
 
-    _units_type = dict([(k, (v[1], v[2])) for k, v in _attr.items()])
+    _units_type = {k: (v[1], v[2]) for k, v in _attr.items()}
 
     base_dir = os.path.dirname(__file__)
 
-    with open(os.path.join(base_dir, 'platforms.json'), 'r') as f:
-        js = json.load(f)
-        plat_types = dict(zip([t['name'] for t in js['vessel']],
-                              js['vessel']))
-        plat_types.update(dict(zip([t['name'] for t in js['aircraft']],
-                                   js['aircraft'])))
+    # loaded from platforms.json the first time it is needed
+    _plat_types = None
 
     _schema = PlatformSchema
 
+    @classmethod
+    def plat_types(cls):
+        '''
+        The predefined vessel and aircraft platforms, by name.
+        '''
+        if Platform._plat_types is None:
+            with open(os.path.join(cls.base_dir, 'platforms.json'), 'r') as f:
+                js = json.load(f)
+
+            Platform._plat_types = {t['name']: t
+                                    for t in js['vessel'] + js['aircraft']}
+
+        return Platform._plat_types
+
     def __init__(self,
                  units=None,
                  type='Platform',
                  **kwargs):
         if '_name' in kwargs:
-            kwargs = self.plat_types[kwargs.get('_name')]
+            kwargs = self.plat_types()[kwargs.get('_name')]
 
         if units is None:
-            units = dict([(k, v[0]) for k, v in self._attr.items()])
+            units = dict(self._si_units)
 
         self.units = units
         self.type = type
@@ -357,8 +413,8 @@ class Platform(GnomeId):
                 unit = self._si_units[attr]
 
         if unit in self._units_type[attr][1]:
-            return uc.convert(self._units_type[attr][0], self.units[attr],
-                              unit, val)
+            return val * _conv_factor(self._units_type[attr][0],
+                                      self.units[attr], unit)
         else:
             ex = uc.InvalidUnitError((unit, self._units_type[attr][0]))
             self.logger.error(str(ex))
@@ -634,8 +690,8 @@ class Disperse(Response):
              'dosage': ('gal/acre', 'oilconcentration',
                         _valid_oil_concentration_units)}
 
-    _si_units = dict([(k, v[0]) for k, v in _attr.items()])
-    _units_type = dict([(k, (v[1], v[2])) for k, v in _attr.items()])
+    _si_units = {k: v[0] for k, v in _attr.items()}
+    _units_type = {k: (v[1], v[2]) for k, v in _attr.items()}
 
     _ref_as = 'roc_disperse'
     _req_refs = ['wind']
@@ -721,7 +777,7 @@ class Disperse(Response):
             self.platform = platform
 
         if units is None:
-            units = dict([(k, v[0]) for k, v in self._attr.items()])
+            units = dict(self._si_units)
         self._units = units
 
         self.wind = wind
@@ -817,7 +873,7 @@ class Disperse(Response):
                                                'state': []}
 
     def dosage_from_thickness(self, sc):
-        thickness = self._get_thickness(sc)  # inches
+        thickness = self._ts_oil_thickness  # inches
 
         self._dosage_m = (uc.convert('length', 'inches', 'm', thickness) /
                           self.disp_oil_ratio)
@@ -901,6 +957,11 @@ class Disperse(Response):
             # do deactivated stuff
             return
 
+        if self.dosage_type == 'auto':
+            # the oil doesn't change while stepping through the states,
+            # so only look up the substance and its density once per step
+            self._ts_oil_thickness = self._get_thickness(sc)
+
         if self.platform.is_boat:
             self.simulate_boat(sc, time_step, model_time)
         else:
@@ -1579,7 +1640,8 @@ class Disperse(Response):
             sc.mass_balance['systems'][self.id]['state'] = []
             return
 
-        sc.mass_balance['systems'][self.id]['state'] = self.state
+        platform_balance = sc.mass_balance['systems'][self.id]
+        platform_balance['state'] = self.state
 
         idxs = self.dispersable_oil_idxs(sc)
 
@@ -1596,6 +1658,7 @@ class Disperse(Response):
             # org_mass = sc['mass'][idxs]
 
             removed = self._remove_mass_indices(sc, mass_to_remove, idxs)
+            total_removed = removed.sum()
             # print('index, original mass, removed mass, final mass')
 
             # masstab = np.column_stack((idxs,
@@ -1603,21 +1666,21 @@ class Disperse(Response):
             #                            mass_to_remove,
             #                            sc['mass'][idxs]))
 
-            sc.mass_balance['chem_dispersed'] += sum(removed)
+            sc.mass_balance['chem_dispersed'] += total_removed
 
             self.logger.warning('spray time: {}'
                                 .format(type(self.platform._ts_spray_time)))
             self.logger.warning('spray time out: {}'
-                                .format(type(sc.mass_balance['systems'][self.id]['time_spraying'])))
+                                .format(type(platform_balance['time_spraying'])))
 
-            sc.mass_balance['systems'][self.id]['time_spraying'] += self.platform._ts_spray_time
-            sc.mass_balance['systems'][self.id]['dispersed'] += sum(removed)
-            sc.mass_balance['systems'][self.id]['area_covered'] += self._area_sprayed_this_ts
-            sc.mass_balance['systems'][self.id]['dispersant_applied'] += self._disp_sprayed_this_timestep
-            sc.mass_balance['systems'][self.id]['oil_treated'] += self.oil_treated_this_timestep
-            sc.mass_balance['systems'][self.id]['payloads_delivered'] += self._ts_payloads_delivered
+            platform_balance['time_spraying'] += self.platform._ts_spray_time
+            platform_balance['dispersed'] += total_removed
+            platform_balance['area_covered'] += self._area_sprayed_this_ts
+            platform_balance['dispersant_applied'] += self._disp_sprayed_this_timestep
+            platform_balance['oil_treated'] += self.oil_treated_this_timestep
+            platform_balance['payloads_delivered'] += self._ts_payloads_delivered
 
-            sc.mass_balance['floating'] -= sum(removed)
+            sc.mass_balance['floating'] -= total_removed
 
             zero_or_disp = np.isclose(sc['mass'][idxs], 0)
             new_status = sc['fate_status'][idxs]
@@ -1694,7 +1757,7 @@ class Burn(Response):
                  speed=None,
                  throughput=None,
                  burn_efficiency_type=None,
-                 units=_si_units,
+                 units=None,
                  **kwargs):
         super(Burn, self).__init__(**kwargs)
 
@@ -1703,7 +1766,8 @@ class Burn(Response):
                                  'frac_water': gat('frac_water')})
 
         self._units = dict(self._si_units)
-        self.units = units
+        if units is not None:
+            self.units = units
 
         self.offset = offset
         self.boom_length = boom_length
@@ -1720,7 +1784,7 @@ class Burn(Response):
 
         self._is_collecting = False
         self._is_burning = False
-        self._is_boom_filled = False
+        self._is_boom_full = False
         self._is_transiting = False
         self._is_cleaning = False
 
@@ -1752,6 +1816,9 @@ class Burn(Response):
         self._offset_time = (self.offset * 0.00987 / self.get('speed')) * 60
         self._area_coverage_rate = self._swath_width * self.get('speed') / 430
 
+        # encounter rate (gal/min) per inch of oil thickness
+        self._encounter_rate_coeff = _ENCOUNTER_K * self._swath_width * self.get('speed')
+
         if self._swath_width > 1000:
             self.report.append('Swaths > 1000 feet may not be achievable '
                                'in the field')
@@ -1810,12 +1877,19 @@ class Burn(Response):
 
         self._time_remaining = time_step
 
+        # none of these change while stepping through the states below,
+        # so work them out once per time step
+        self._ts_is_active = self._is_active(model_time, time_step)
+        self._ts_frac_water = sc['frac_water'].mean()
+        self._ts_oil_thickness = self._get_thickness(sc, self._ts_frac_water)
+        self._ts_density = sc['density'].mean()
+
         while self._time_remaining > 0.:
             if (self._is_collecting is False and
                     self._is_transiting is False and
                     self._is_burning is False and
                     self._is_cleaning is False and
-                    self._is_active(model_time, time_step)):
+                    self._ts_is_active):
                 self._is_collecting = True
 
             if self._is_collecting:
@@ -1833,33 +1907,28 @@ class Burn(Response):
     def _collect(self, sc, time_step, model_time):
         # calculate amount collected this time_step
         if self._burn_rate is None:
-            self._burn_rate = 0.14 * (1 - sc['frac_water'].mean())
+            self._burn_rate = 0.14 * (1 - self._ts_frac_water)
 
-        oil_thickness = self._get_thickness(sc)
-        encounter_rate = (63.13 *
-                          self._swath_width *
-                          oil_thickness *
-                          self.get('speed'))
+        oil_thickness = self._ts_oil_thickness
+        encounter_rate = self._encounter_rate_coeff * oil_thickness
         emulsion_rr = encounter_rate * self.throughput
 
-        self._boomed_density = sc['density'].mean()
+        self._boomed_density = self._ts_density
 
         if oil_thickness > 0:
             # old ROC equation
             # time_to_fill = (self._boom_capacity_remaining / emulsion_rr) * 60
             # new ebsp equation
-            time_to_fill = (uc.convert('Volume',
-                                       'ft^3', 'gal',
-                                       self._boom_capacity) /
+            time_to_fill = (self._boom_capacity *
+                            _conv_factor('Volume', 'ft^3', 'gal') /
                             emulsion_rr)
         else:
             time_to_fill = self._time_remaining
 
         if time_to_fill >= self._time_remaining:
             # doesn't finish filling the boom in this time step
-            self._ts_collected = uc.convert('Volume',
-                                            'gal', 'ft^3',
-                                            emulsion_rr * self._time_remaining)
+            self._ts_collected = (emulsion_rr * self._time_remaining *
+                                  _conv_factor('Volume', 'gal', 'ft^3'))
             self._boom_capacity -= self._ts_collected
             self._ts_area_covered = encounter_rate * self._time_remaining / 60.
             self._time_collecting_in_sim += self._time_remaining
@@ -1870,9 +1939,8 @@ class Burn(Response):
         elif self._time_remaining > 0:
             # finishes filling the boom in this time step any time remaining
             # should be spend transiting to the burn position
-            self._ts_collected = uc.convert('Volume',
-                                            'gal', 'ft^3',
-                                            emulsion_rr * time_to_fill)
+            self._ts_collected = (emulsion_rr * time_to_fill *
+                                  _conv_factor('Volume', 'gal', 'ft^3'))
 
             self._ts_area_covered = encounter_rate * (time_to_fill / 60)
             self._boom_capacity -= self._ts_collected
@@ -1978,7 +2046,7 @@ class Burn(Response):
 
             self._is_cleaning = False
 
-            if self._is_active(model_time, time_step):
+            if self._ts_is_active:
                 self._is_transiting = True
                 self._offset_time_remaining = self._offset_time
             else:
@@ -1993,18 +2061,19 @@ class Burn(Response):
             sc.mass_balance['systems'][self.id]['state'] = []
             return
 
+        mass_balance = sc.mass_balance
+        platform_balance = mass_balance['systems'][self.id]
+
+        # these don't depend on the substance, so only count them once
+        platform_balance['area_covered'] += self._ts_area_covered
+        platform_balance['num_burns'] += self._ts_num_burns
+        platform_balance['state'] = self._state_list
+
         les = sc.itersubstancedata(self.array_types)
         for substance, data in les:
             if len(data['mass']) == 0:
-                sc.mass_balance['systems'][self.id]['state'] = self._state_list
-                sc.mass_balance['systems'][self.id]['area_covered'] += self._ts_area_covered
-
                 continue
 
-            sc.mass_balance['systems'][self.id]['area_covered'] += self._ts_area_covered
-            sc.mass_balance['systems'][self.id]['num_burns'] += self._ts_num_burns
-            sc.mass_balance['systems'][self.id]['state'] = self._state_list
-
             if self._ts_collected > 0:
                 collected = (uc.convert('Volume',
                                         'ft^3', 'm^3',
@@ -2012,8 +2081,8 @@ class Burn(Response):
                              self._boomed_density)
                 actual_collected = self._remove_mass_simple(data, collected)
 
-                sc.mass_balance['boomed'] += actual_collected
-                sc.mass_balance['systems'][self.id]['boomed'] += actual_collected
+                mass_balance['boomed'] += actual_collected
+                platform_balance['boomed'] += actual_collected
 
                 if actual_collected != collected:
                     # ran out of oil while collecting har har...
@@ -2024,26 +2093,27 @@ class Burn(Response):
                                           substance.name,
                                           collected))
 
-            if self._ts_burned > 0:
-                burned = (uc.convert('Volume',
-                                     'ft^3', 'm^3',
-                                     self._ts_burned) *
-                          self._boomed_density)
+        if self._ts_burned > 0:
+            # burning takes oil out of the boom, not off the LEs
+            burned = (uc.convert('Volume',
+                                 'ft^3', 'm^3',
+                                 self._ts_burned) *
+                      self._boomed_density)
 
-                sc.mass_balance['burned'] += burned
-                sc.mass_balance['boomed'] -= burned
-                sc.mass_balance['systems'][self.id]['burned'] += burned
-                sc.mass_balance['systems'][self.id]['time_burning'] = self._time_burning
+            mass_balance['burned'] += burned
+            mass_balance['boomed'] -= burned
+            platform_balance['burned'] += burned
+            platform_balance['time_burning'] = self._time_burning
 
-                # make sure we didn't burn more than we boomed
-                # if so correct the amount
-                if sc.mass_balance['boomed'] < 0:
-                    sc.mass_balance['burned'] += sc.mass_balance['boomed']
-                    sc.mass_balance['systems'][self.id]['burned'] += sc.mass_balance['boomed']
-                    sc.mass_balance['boomed'] = 0
+            # make sure we didn't burn more than we boomed
+            # if so correct the amount
+            if mass_balance['boomed'] < 0:
+                mass_balance['burned'] += mass_balance['boomed']
+                platform_balance['burned'] += mass_balance['boomed']
+                mass_balance['boomed'] = 0
 
-                self.logger.debug('{0} amount burned for {1}: {2}'
-                                  .format(self._pid, substance.name, burned))
+            self.logger.debug('{0} amount burned: {1}'
+                              .format(self._pid, burned))
 
 
 class SkimUnitsSchema(MappingSchema):
@@ -2122,7 +2192,7 @@ class Skim(Response):
                  discharge_pump=None,
                  rig_time=None,
                  transit_time=None,
-                 units=_si_units,
+                 units=None,
                  **kwargs):
         super(Skim, self).__init__(**kwargs)
 
@@ -2142,6 +2212,8 @@ class Skim(Response):
         self.transit_time = transit_time
 
         self._units = dict(self._si_units)
+        if units is not None:
+            self.units = units
 
         self._is_collecting = False
         self._is_transiting = False
@@ -2150,13 +2222,21 @@ class Skim(Response):
 
     def prepare_for_model_run(self, sc):
         self._setup_report(sc)
-        self._storage_remaining = self.get('storage', 'gal')
 
-        self._coverage_rate = (self.get('swath_width') *
-                               self.get('speed') *
-                               0.00233)
+        # these don't change over the run, so only convert them once
+        self._speed = self.get('speed', 'kts')
+        self._swath_width = self.get('swath_width', 'ft')
+        self._nameplate_pump = self.get('nameplate_pump', 'gpm')
+        self._decant_pump = self.get('decant_pump', 'gpm')
+        self._storage = self.get('storage', 'gal')
+
+        self._storage_remaining = self._storage
 
-        self.offload = (self.get('storage', 'gal') /
+        self._coverage_rate = (self._swath_width *
+                               self._speed *
+                               _COVERAGE_K)
+
+        self.offload = (self._storage /
                         self.get('discharge_pump', 'gpm') *
                         60.)
 
@@ -2205,6 +2285,11 @@ class Skim(Response):
 
         self._time_remaining = time_step
 
+        # the oil doesn't change while stepping through the states,
+        # so work these out once per step
+        self._ts_frac_water = sc['frac_water'].mean()
+        self._ts_oil_thickness = self._get_thickness(sc, self._ts_frac_water)
+
         if (hasattr(self, 'barge_arrival') and
                 self.barge_arrival is not None):
             # if there's a barge so a modified cycle
@@ -2212,13 +2297,13 @@ class Skim(Response):
                 if self._is_collecting:
                     self._collect(sc, time_step, model_time)
         else:
+            # model_time doesn't change while stepping through the states
+            is_active = self._is_active(model_time, time_step)
+
             while (self._time_remaining > 0. and
-                   self._is_active(model_time, time_step) or
-                   self._time_remaining > 0. and
-                   self._is_transiting or
-                   self._time_remaining > 0. and
-                   self._is_offloading):
-                # TODO: A bunch of conditional logic above seems redundant
+                   (is_active or
+                    self._is_transiting or
+                    self._is_offloading)):
                 if self._is_collecting:
                     self._collect(sc, time_step, model_time)
 
@@ -2229,29 +2314,29 @@ class Skim(Response):
                     self._offload(sc, time_step, model_time)
 
     def _collect(self, sc, time_step, model_time):
-        thickness = self._get_thickness(sc)
+        thickness = self._ts_oil_thickness
 
         if self.recovery_ef > 0 and self.throughput > 0 and thickness > 0:
-            self._maximum_effective_swath = (self.get('nameplate_pump') *
-                                             self.get('recovery_ef') /
-                                             (63.13 *
-                                              self.get('speed', 'kts') *
+            self._maximum_effective_swath = (self._nameplate_pump *
+                                             self.recovery_ef /
+                                             (_ENCOUNTER_K *
+                                              self._speed *
                                               thickness *
                                               self.throughput))
         else:
             self._maximum_effective_swath = 0
 
-        if self.get('swath_width', 'ft') > self._maximum_effective_swath:
+        if self._swath_width > self._maximum_effective_swath:
             swath = self._maximum_effective_swath
         else:
-            swath = self.get('swath_width', 'ft')
+            swath = self._swath_width
 
         if swath > 1000:
             self.report.append('Swaths > 1000 feet may not be achievable '
                                'in the field.')
 
-        encounter_rate = thickness * self.get('speed', 'kts') * swath * 63.13
-        rate_of_coverage = swath * self.get('speed', 'kts') * 0.00233
+        encounter_rate = thickness * self._speed * swath * _ENCOUNTER_K
+        rate_of_coverage = swath * self._speed * _COVERAGE_K
 
         if encounter_rate > 0:
             recovery = self._getRecoveryEfficiency()
@@ -2261,11 +2346,11 @@ class Skim(Response):
                                           self.throughput /
                                           recovery)
 
-                if totalFluidRecoveryRate > self.get('nameplate_pump'):
+                if totalFluidRecoveryRate > self._nameplate_pump:
                     # total fluid recovery rate is greater than nameplate
                     # pump, recalculate the throughput efficiency and
                     # total fluid recovery rate again with the new throughput
-                    throughput = (self.get('nameplate_pump') *
+                    throughput = (self._nameplate_pump *
                                   recovery /
                                   encounter_rate)
                     totalFluidRecoveryRate = (encounter_rate *
@@ -2290,16 +2375,16 @@ class Skim(Response):
 
                     decantRateDifference = 0.
 
-                    if computedDecantRate > self.get('decant_pump'):
+                    if computedDecantRate > self._decant_pump:
                         decantRateDifference = (computedDecantRate -
-                                                self.get('decant_pump'))
+                                                self._decant_pump)
 
                     recoveryRate = emulsionRecoveryRate + waterRecoveryRate
                     retainRate = (emulsionRecoveryRate +
                                   waterRetainedRate +
                                   decantRateDifference)
                     oilRecoveryRate = (emulsionRecoveryRate *
-                                       (1 - sc['frac_water'].mean()))
+                                       (1 - self._ts_frac_water))
                     # waterTakenOn = (totalFluidRecoveryRate -
                     #                 emulsionRecoveryRate)
 
@@ -2335,10 +2420,10 @@ class Skim(Response):
                     if (fluid_collected > 0 and
                             fluid_collected <= self._storage_remaining):
                         self._ts_num_fills += (fluid_collected /
-                                               self.get('storage', 'gal'))
+                                               self._storage)
                     elif self._storage_remaining > 0:
                         self._ts_num_fills += (self._storage_remaining /
-                                               self.get('storage', 'gal'))
+                                               self._storage)
 
                     if fluid_collected > self._storage_remaining:
                         self._storage_remaining = 0
@@ -2398,7 +2483,7 @@ class Skim(Response):
 
             self._time_remaining -= self._offload_remaining
             self._offload_remaining = 0.
-            self._storage_remaining = self.get('storage', 'gal')
+            self._storage_remaining = self._storage
 
             self._is_offloading = False
             self._is_transiting = True
@@ -2419,38 +2504,41 @@ class Skim(Response):
             sc.mass_balance['systems'][self.id]['state'] = []
             return
 
+        platform_balance = sc.mass_balance['systems'][self.id]
+        platform_balance['state'] = self._state_list
+
+        if (not hasattr(self, '_ts_oil_collected') or
+                self._ts_oil_collected is None):
+            return
+
         les = sc.itersubstancedata(self.array_types)
         for substance, data in les:
             if len(data['mass']) == 0:
-                sc.mass_balance['systems'][self.id]['state'] = self._state_list
                 continue
 
-            sc.mass_balance['systems'][self.id]['state'] = self._state_list
+            actual = self._remove_mass_simple(data, self._ts_oil_collected)
 
-            if (hasattr(self, '_ts_oil_collected') and
-                    self._ts_oil_collected is not None):
-                actual = self._remove_mass_simple(data, self._ts_oil_collected)
+            sc.mass_balance['skimmed'] += actual
 
-                sc.mass_balance['skimmed'] += actual
+            self.logger.debug('{0} amount boomed for {1}: {2}'
+                              .format(self._pid,
+                                      substance.name,
+                                      self._ts_oil_collected))
 
-                self.logger.debug('{0} amount boomed for {1}: {2}'
-                                  .format(self._pid,
-                                          substance.name,
-                                          self._ts_oil_collected))
-
-                platform_balance = sc.mass_balance['systems'][self.id]
-                platform_balance['skimmed'] += actual
-                platform_balance['time_collecting'] += self._ts_time_collecting
-                platform_balance['fluid_collected'] += self._ts_fluid_collected
-                platform_balance['emulsion_collected'] += self._ts_emulsion_collected
-                platform_balance['oil_collected'] += actual
-                platform_balance['water_collected'] += self._ts_water_collected
-                platform_balance['water_retained'] += self._ts_water_retained
-                platform_balance['water_decanted'] += self._ts_water_decanted
-                platform_balance['area_covered'] += self._ts_area_covered
-                platform_balance['storage_remaining'] += self._storage_remaining
-
-                platform_balance['num_fills'] += self._ts_num_fills
+            platform_balance['skimmed'] += actual
+            platform_balance['oil_collected'] += actual
+
+        # these don't depend on the substance, so only count them once
+        platform_balance['time_collecting'] += self._ts_time_collecting
+        platform_balance['fluid_collected'] += self._ts_fluid_collected
+        platform_balance['emulsion_collected'] += self._ts_emulsion_collected
+        platform_balance['water_collected'] += self._ts_water_collected
+        platform_balance['water_retained'] += self._ts_water_retained
+        platform_balance['water_decanted'] += self._ts_water_decanted
+        platform_balance['area_covered'] += self._ts_area_covered
+        platform_balance['storage_remaining'] += self._storage_remaining
+
+        platform_balance['num_fills'] += self._ts_num_fills
 
     def _getRecoveryEfficiency(self):
         # scaffolding method will eventually include logic for calculating
@@ -79,7 +79,7 @@ def test_read_single_cell_center():
 
     assert data_type == 'currents'
     assert units == 'KNOTS'
-    assert times == [datetime(2002, 1, 30, 1, 0)]  # 30 1 2002 1 0
+    assert np.array_equal(times, [datetime(2002, 1, 30, 1, 0)])  # 30 1 2002 1 0
     assert np.array_equal(lon, [12, 15])
     assert np.array_equal(lat, [44, 46])
 
@@ -97,7 +97,7 @@ def test_read_single_cell_nodes():
         test_data_dir / "grid_cur_2x2.cur")
     assert data_type == 'currents'
     assert units == 'm/s'
-    assert times == [datetime(2012, 1, 30, 1, 15)]  # 30 1 2002 1 0
+    assert np.array_equal(times, [datetime(2012, 1, 30, 1, 15)])  # 30 1 2002 1 0
     assert np.array_equal(lon, [-70, -67])
     assert np.array_equal(lat, [45, 47])
 
@@ -124,19 +124,18 @@ def test_read_cells_multiple_times():
 
     assert data_type == 'currents'
     assert units == 'm/s'
-    assert times == [datetime(2020, 7, 14, 12, 0),
-                     datetime(2020, 7, 14, 18, 0),
-                     datetime(2020, 7, 15, 0, 0),
-                     ]
+    assert times.dtype == np.dtype('datetime64[s]')
+    assert np.array_equal(times, [datetime(2020, 7, 14, 12, 0),
+                                  datetime(2020, 7, 14, 18, 0),
+                                  datetime(2020, 7, 15, 0, 0),
+                                  ])
 
     assert np.array_equal(lon, np.linspace(-88.0, -86.0, 21))
     assert np.array_equal(lat, np.linspace(29.0, 30.0, 11))
 
-    assert len(data_u) == 3
-    assert len(data_v) == 3
-    for U, V in zip(data_u, data_v):
-        U.shape == (20, 10)
-        V.shape == (20, 10)
+    # all the timesteps in one (time, row, col) array
+    assert data_u.shape == (3,) + (20, 10)
+    assert data_v.shape == (3,) + (20, 10)
     # A few values, just to be sure, but ...
     assert data_u[0][0, 0] == 0.5
     assert data_v[0][0, 0] == 0.0
@@ -150,19 +149,18 @@ def test_read_nodes_multiple_times():
 
     assert data_type == 'currents'
     assert units == 'm/s'
-    assert times == [datetime(2020, 7, 14, 12, 0),
-                     datetime(2020, 7, 14, 18, 0),
-                     datetime(2020, 7, 15, 0, 0),
-                     ]
+    assert times.dtype == np.dtype('datetime64[s]')
+    assert np.array_equal(times, [datetime(2020, 7, 14, 12, 0),
+                                  datetime(2020, 7, 14, 18, 0),
+                                  datetime(2020, 7, 15, 0, 0),
+                                  ])
 
     assert np.array_equal(lon, np.linspace(-88.0, -86.0, 21))
     assert np.array_equal(lat, np.linspace(29.0, 30.0, 11))
 
-    assert len(data_u) == 3
-    assert len(data_v) == 3
-    for U, V in zip(data_u, data_v):
-        U.shape == (21, 11)
-        V.shape == (21, 11)
+    # all the timesteps in one (time, row, col) array
+    assert data_u.shape == (3,) + (21, 11)
+    assert data_v.shape == (3,) + (21, 11)
     # A few values, just to be sure, but ...
     assert data_u[0][0, 0] == 0.5
     assert data_v[0][0, 0] == 0.0
@@ -171,6 +169,54 @@ def test_read_nodes_multiple_times():
     assert data_v[-1][20, 10] == 0.804984
 
 
+def test_read_partial_timesteps():
+    """
+    a timestep doesn't have to list every cell -- the rest are zero
+    """
+    filename = test_output_dir / "partial_gridcur.cur"
+    filename.write_text("[GRIDCURTIME] KNOTS\n"
+                        "NUMROWS 2\n"
+                        "NUMCOLS 2\n"
+                        "STARTLAT 44\n"
+                        "STARTLONG 12\n"
+                        "DLAT 2\n"
+                        "DLONG 3\n"
+                        "[TIME]   30 1 2002 1 0\n"
+                        "1 2 .5 -.25\n"
+                        "[TIME]   30 1 2002 2 0\n"
+                        "2 1 .1 .2\n"
+                        "2 2 .3 .4\n")
+    data_type, units, times, lon, lat, data_u, data_v = gridcur.read_file(filename)
+
+    assert np.array_equal(times, [datetime(2002, 1, 30, 1, 0),
+                                  datetime(2002, 1, 30, 2, 0)])
+    assert np.array_equal(data_u, [[[0.0, 0.5], [0.0, 0.0]],
+                                   [[0.0, 0.0], [0.1, 0.3]]])
+    assert np.array_equal(data_v, [[[0.0, -0.25], [0.0, 0.0]],
+                                   [[0.0, 0.0], [0.2, 0.4]]])
+
+
+def test_read_float32():
+    data_u, data_v = gridcur.read_file(NODE_EXAMPLE, dtype=np.float32)[-2:]
+
+    assert data_u.dtype == np.float32
+    assert data_v.dtype == np.float32
+
+    assert data_u[-1][20, 10] == np.float32(0.402492)
+    assert data_v[-1][20, 10] == np.float32(0.804984)
+
+
+@pytest.mark.parametrize("example", [CELL_EXAMPLE, NODE_EXAMPLE])
+def test_write_round_trip(example):
+    """
+    writing what was read should give back the same file
+    """
+    outfile = test_output_dir / ("round_trip_" + example.name)
+    gridcur.write_gridcur(outfile, *gridcur.read_file(example))
+
+    assert outfile.read_text() == example.read_text()
+
+
 def test_GridR_node():
     # NOTE: The value-on-the-nodes version is the only one supported
     cur = gridcur.from_gridcur(filename=test_data_dir / NODE_EXAMPLE)
@@ -215,6 +215,29 @@ def test_variable_attributes(model):
         print(val, name)
 
 
+def test_chunking(model):
+    """
+    the data variables should be chunked with the requested chunksize,
+    and compressed with the outputter's deflate level
+    """
+    o_put = [o for o in model.outputters if isinstance(o, NetCDFOutput)][0]
+    assert o_put.chunksize == 1024
+    o_put.chunksize = 512
+
+    model.rewind()
+    model.step()
+
+    with nc.Dataset(o_put.filename) as ds:
+        mass = ds.variables['mass']
+        assert mass.chunking() == [512]
+        assert mass.filters()['zlib']
+        assert mass.filters()['complevel'] == NetCDFOutput.complevel
+
+
+def test_chunksize_init(output_filename):
+    assert NetCDFOutput(output_filename, chunksize=512).chunksize == 512
+
+
 # @pytest.mark.slow
 def test_write_output_standard(model):
     """
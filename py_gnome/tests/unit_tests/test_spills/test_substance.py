@@ -25,6 +25,33 @@ class TestSubstance:
         assert sub1.windage_range == (0.01, 0.04)
         assert sub1.windage_persist == 900
 
+    def test_all_array_types_cached(self):
+        sub1 = Substance()
+        arr_types = sub1.all_array_types
+
+        assert sub1.all_array_types is arr_types
+
+        # changing the initializers resets the cache
+        sub1.initializers = []
+        assert sub1.all_array_types is not arr_types
+        assert sub1.all_array_types.keys() == sub1.array_types.keys()
+
+    def test_get_initializer_by_name(self):
+        sub1 = Substance()
+        init = sub1._windage_init
+
+        assert sub1.get_initializer_by_name(init.name) is init
+        assert sub1.get_initializer_by_name('not an initializer') is None
+
+    def test_has_initializer(self):
+        sub1 = Substance()
+
+        assert sub1.has_initializer('windages')
+        assert not sub1.has_initializer('rise_vel')
+
+        sub1.initializers = []
+        assert not sub1.has_initializer('windages')
+
     def test_init_inf_persist(self):
         """
         setting windage_persist to inf should set it to -1
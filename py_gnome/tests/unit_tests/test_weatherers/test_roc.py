@@ -12,6 +12,8 @@ import numpy as np
 
 import pytest
 
+from colander import Invalid
+
 from gnome.environment import Waves, constant_wind, Water
 
 from gnome.weatherers.roc import (Burn, Disperse, Skim, Platform)
@@ -252,6 +254,14 @@ class TestROCBurn(ROCTests):
         print(b._diff(b2))
         assert b == b2
 
+    def test_deserialize_invalid_timeseries(self):
+        ser = TestROCBurn.burn.serialize()
+        # ends before it starts
+        ser['timeseries'] = [ser['timeseries'][0][::-1]]
+
+        with pytest.raises(Invalid):
+            Burn.deserialize(ser)
+
     def test_step(self, sample_model_fcn2):
         self.sc, self.model, self.environment = ROCTests.mk_objs(sample_model_fcn2)
 
@@ -271,6 +281,13 @@ class TestPlatform(ROCTests):
         p = Platform(_name="Test Platform", units={'transit_speed': 'm/s'})
         assert p.units['transit_speed'] == 'm/s'
 
+    def test_plat_types(self):
+        plat_types = Platform.plat_types()
+
+        assert 'Test Platform' in plat_types
+        # only loaded once
+        assert Platform.plat_types() is plat_types
+
     def test_serialization(self):
         p = Platform(_name='Test Platform')
 
@@ -543,6 +560,17 @@ class TestRocSkim(ROCTests):
                              datetime(2012, 9, 16, 1, 0))],
                 transit_time=timedelta(hours=2).total_seconds())
 
+    def test_units(self):
+        s = Skim(storage=84000.0, units={'storage': 'gal'})
+
+        assert s.units['storage'] == 'gal'
+        assert s.units['speed'] == 'kts'
+        assert s.get('storage', 'bbl') == pytest.approx(2000.0)
+
+        # the class defaults are not changed
+        assert Skim._si_units['storage'] == 'bbl'
+        assert TestRocSkim.skim.units['storage'] == 'bbl'
+
     def test_prepare_for_model_run(self, sample_model_fcn2):
         self.sc, self.model, self.environment = ROCTests.mk_objs(sample_model_fcn2)
 